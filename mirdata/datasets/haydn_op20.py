@@ -9,25 +9,37 @@
     This dataset contains 30 pieces composed by Joseph Haydn in symbolic format, which have each been manually
     annotated with harmonic analyses.
 """
+import collections.abc
+from fractions import Fraction
+import hashlib
 import logging
+import operator
 import os
-from typing import Optional, TextIO, List
+import pickle
+import re
+import sys
+import tempfile
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Mapping,
+    Optional,
+    TextIO,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
 
 from deprecated.sphinx import deprecated
 import numpy as np
+from smart_open import open
 
 from mirdata import core, io, jams_utils, download_utils
+from mirdata.annotations import KeyData, ChordData
 
-try:
+if TYPE_CHECKING:
     import music21
-except ImportError:
-    logging.error(
-        "In order to use haydn_op20 you must have music21 installed. "
-        "Please reinstall mirdata using `pip install 'mirdata[haydn_op20]'"
-    )
-    raise ImportError
-
-from mirdata.annotations import KeyData, ChordData
 
 BIBTEX = """
 @dataset{nestor_napoles_lopez_2017_1095630,
@@ -59,6 +71,93 @@ LICENSE_INFO = (
     "Creative Commons Attribution Non Commercial Share Alike 4.0 International."
 )
 
+# Default number of pulses, or ticks, per quarter note (PPQ) of the annotation times
+DEFAULT_RESOLUTION = 28
+
+# Set to True to cache the parsed annotations on disk, so that subsequent
+# loads of an unchanged file skip the music21 parser.
+USE_PARSE_CACHE = False
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mirdata", "haydn_op20")
+# Bump when the layout of the cached annotation records changes
+_CACHE_VERSION = 2
+
+# music21 takes a long time to import, so it is only imported on first use
+_music21 = None
+
+
+def _require_music21():
+    """Import music21 on first use
+
+    Returns:
+        module: the music21 module
+
+    """
+    global _music21
+    if _music21 is None:
+        try:
+            import music21
+            import music21.humdrum.harmparser
+        except ImportError:
+            logging.error(
+                "In order to use haydn_op20 you must have music21 installed. "
+                "Please reinstall mirdata using `pip install 'mirdata[haydn_op20]'"
+            )
+            raise
+        _music21 = music21
+    return _music21
+
+
+class _Record(collections.abc.Mapping):
+    """Read-only annotation record that behaves like a dict, e.g. ``record["time"]``
+
+    Records use ``__slots__`` instead of a per-instance dict, which keeps long
+    annotation lists small. They compare equal to dicts with the same items.
+
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("{} is read-only".format(type(self).__name__))
+
+    def __reduce__(self):
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(name, getattr(self, name)) for name in self.__slots__
+            ),
+        )
+
+
+class _KeyRec(_Record):
+    __slots__ = ("time", "key")
+
+
+class _ChordRec(_Record):
+    __slots__ = ("time", "chord")
+
+
+class _RomanNumeralRec(_Record):
+    __slots__ = ("time", "roman_numeral")
+
 
 class Track(core.Track):
     """haydn op20 track class
@@ -99,41 +198,72 @@ class Track(core.Track):
         )
         self.humdrum_annotated_path = self.get_path("annotations")
         self.title = os.path.splitext(self._track_paths["annotations"][0])[0]
+        self._use_parse_cache = USE_PARSE_CACHE
+        self._cache_dir = None
+
+    @core.cached_property
+    def _parsed(self):
+        score = _parse_score_file(self.humdrum_annotated_path)
+        return score, _extract_rna(score)
+
+    @core.cached_property
+    def _records(self):
+        if self._use_parse_cache:
+            # on a cache miss, reuse (and keep) the parsed score
+            return _cached_parse(
+                self.humdrum_annotated_path,
+                cache_dir=self._cache_dir,
+                load_rna=lambda: self._parsed[1],
+            )
+        return _rna_to_records(self._parsed[1])
+
+    @core.cached_property
+    def _annotations(self):
+        return _extract_all(self._records, DEFAULT_RESOLUTION)
 
     @core.cached_property
-    def score(self) -> music21.stream.Score:
-        return load_score(self.humdrum_annotated_path)
+    def score(self) -> "music21.stream.Score":
+        return self._parsed[0]
 
     @core.cached_property
     def keys(self) -> Optional[KeyData]:
-        return load_key(self.humdrum_annotated_path)
+        return _keys_to_key_data(self._annotations["times"], self._annotations["keys"])
 
     @core.cached_property
-    def keys_music21(self) -> Optional[List[dict]]:
-        return load_key_music21(self.humdrum_annotated_path)
+    def keys_music21(self) -> Optional[List[Mapping[str, Any]]]:
+        return _to_records(
+            self._annotations["times"], self._annotations["keys"], _KeyRec
+        )
 
     @core.cached_property
-    def roman_numerals(self) -> Optional[List[dict]]:
+    def roman_numerals(self) -> Optional[List[Mapping[str, Any]]]:
         return load_roman_numerals(self.humdrum_annotated_path)
 
     @core.cached_property
     def chords(self) -> Optional[ChordData]:
-        return load_chords(self.humdrum_annotated_path)
+        return _chords_to_chord_data(
+            self._annotations["times"], self._annotations["chords"]
+        )
 
     @core.cached_property
-    def chords_music21(self) -> Optional[List[dict]]:
-        return load_chords_music21(self.humdrum_annotated_path)
+    def chords_music21(self) -> Optional[List[Mapping[str, Any]]]:
+        return _to_records(
+            self._annotations["times"], self._annotations["chords"], _ChordRec
+        )
 
     @core.cached_property
     def duration(self) -> int:
-        return self.chords_music21[-1]["time"]
+        return self._annotations["duration"]
 
     @core.cached_property
     def midi_path(self) -> Optional[str]:
         logging.warning(
             "midi_path is deprecated as of 0.3.4 and will be removed in a future version."
         )
-        return convert_and_save_to_midi(self.humdrum_annotated_path)
+        midi_path = _midi_path_for(self.humdrum_annotated_path)
+        if not _midi_exists(midi_path):
+            _save_score_to_midi(self.score, midi_path)
+        return midi_path
 
     def to_jams(self):
         """Get the track's data in jams format
@@ -157,22 +287,244 @@ class Track(core.Track):
         )
 
 
-def _split_score_annotations(fhandle: TextIO):
-    """Load haydn op20 score and annotations divided.
+def _parse_score_file(path: str):
+    """Parse a haydn op20 humdrum file with music21.
+
+    Parsing by path lets music21 reuse its own pickled copy of the file.
+
+    Args:
+        path (str): path to hrm annotations
+
+    Returns:
+        music21.stream.Score: score in music21 format, including the roman numerals
+    """
+    return _require_music21().converter.parseFile(path, format="humdrum")
+
+
+def _parse_score(fhandle: TextIO):
+    """Parse a haydn op20 humdrum file handle with music21.
 
     Args:
         fhandle (str or file-like): path to hrm annotations
 
     Returns:
-        music21.stream.Score: score in music21 format
-        list: list of roman numerals [(time in seconds, roman numeral)]
+        music21.stream.Score: score in music21 format, including the roman numerals
+    """
+    if hasattr(fhandle, "name"):
+        return _parse_score_file(fhandle.name)
+    # in-memory file, parse its contents directly
+    return _require_music21().converter.parse(fhandle.read(), format="humdrum")
+
+
+def _extract_rna(score):
+    """Extract the roman numeral annotations of a score, without modifying it.
+
+    The same roman numeral is attached to every part, so annotations are
+    deduplicated by offset. The score is traversed in place rather than
+    flattened, which would copy every element.
+
+    Args:
+        score (music21.stream.Score): score in music21 format
+
+    Returns:
+        list: list of roman numerals [(offset in quarter notes, roman numeral)]
     """
-    score = music21.converter.parse(fhandle.name, format="humdrum")
+    rna = {
+        rn.getOffsetInHierarchy(score): rn
+        for rn in score.recurse().getElementsByClass(
+            _require_music21().roman.RomanNumeral
+        )
+    }
+    # parts are traversed one after the other, so restore the time order
+    return [(offset, rna[offset]) for offset in sorted(rna) if rna[offset]]
+
+
+def _rna_to_records(rna):
+    """Convert parsed roman numerals to picklable annotation records
+
+    Args:
+        rna (list): list of roman numerals [(offset, music21.roman.RomanNumeral)]
+
+    Returns:
+        list: list of dicts with the offset, key, secondary key and pitched
+            common name of each roman numeral
 
-    rna = {rn.offset: rn for rn in list(score.flat.getElementsByClass("RomanNumeral"))}
-    score.remove(rna, recurse=True)
-    rna_clean = [(offset, rn) for offset, rn in rna.items() if rn]
-    return score, rna_clean
+    """
+    records = []
+    # pitchedCommonName builds a new chord on every call, but it only depends
+    # on the figure and the key, which repeat a lot within a piece
+    pitched_common_names = {}
+    get_attributes = operator.attrgetter("figure", "key", "secondaryRomanNumeralKey")
+    for offset, rn in rna:
+        figure, key, secondary_key = get_attributes(rn)
+        key_str = sys.intern(str(key)) if key else None
+        name_key = (figure, key_str)
+        if name_key not in pitched_common_names:
+            pitched_common_names[name_key] = rn.pitchedCommonName
+        records.append(
+            {
+                "offset": float(offset),
+                "key_str": key_str,
+                "secondary_key_str": (
+                    sys.intern(str(secondary_key)) if secondary_key else None
+                ),
+                "pitchedCommonName": pitched_common_names[name_key],
+            }
+        )
+    return records
+
+
+def _cached_parse(path, cache_dir=None, load_rna=None):
+    """Load the annotation records of a humdrum file, using an on-disk cache
+
+    The cache is keyed by the file path, modification time and size, the
+    record format version and the music21 version, so edited files and
+    records written by other versions are parsed again. Corrupt cache files
+    are ignored and rewritten.
+
+    Args:
+        path (str): path to hrm annotations
+        cache_dir (str or None): directory where parsed records are stored.
+            If None, ``~/.cache/mirdata/haydn_op20`` is used.
+        load_rna (callable or None): called on a cache miss to get the roman
+            numerals of the file, as returned by ``_extract_rna``.
+            If None, the file is parsed.
+
+    Returns:
+        list: annotation records, as returned by ``_rna_to_records``
+
+    """
+    if cache_dir is None:
+        cache_dir = _CACHE_DIR
+    stat = os.stat(path)
+    cache_key = hashlib.md5(
+        "{}:{}:{}:{}:{}".format(
+            _CACHE_VERSION,
+            _require_music21().__version__,
+            os.path.abspath(path),
+            stat.st_mtime_ns,
+            stat.st_size,
+        ).encode()
+    ).hexdigest()
+    cache_path = os.path.join(cache_dir, cache_key + ".pkl")
+    try:
+        with open(cache_path, "rb") as fhandle:
+            return pickle.load(fhandle)
+    except FileNotFoundError:
+        pass
+    except (EOFError, pickle.UnpicklingError):
+        logging.warning(
+            "Ignoring corrupt haydn_op20 parse cache file {}".format(cache_path)
+        )
+
+    if load_rna is None:
+        rna = _extract_rna(_parse_score_file(path))
+    else:
+        rna = load_rna()
+    records = _rna_to_records(rna)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file first so that concurrent readers and writers
+    # never see a partially written cache file
+    fhandle = tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False)
+    try:
+        with fhandle:
+            pickle.dump(records, fhandle)
+        os.replace(fhandle.name, cache_path)
+    except BaseException:
+        os.remove(fhandle.name)
+        raise
+    return records
+
+
+def _load_records(fhandle):
+    """Load the annotation records of a humdrum file
+
+    Args:
+        fhandle (str or file-like): path to hrm annotations
+
+    Returns:
+        list: annotation records, as returned by ``_rna_to_records``
+
+    """
+    if USE_PARSE_CACHE and hasattr(fhandle, "name"):
+        return _cached_parse(fhandle.name)
+    return _rna_to_records(_extract_rna(_parse_score(fhandle)))
+
+
+def _key_from_string(key_string):
+    """Build a music21 key from its string representation, e.g. "E- major"
+
+    Args:
+        key_string (str or None): key string
+
+    Returns:
+        music21.key.Key: music21 key, or None if key_string is None
+
+    """
+    if key_string is None:
+        return None
+    return _require_music21().key.Key(*key_string.split(" "))
+
+
+def _extract_all(records, resolution):
+    """Compute the key and chord annotations in a single pass
+
+    Args:
+        records (list): annotation records, as returned by ``_rna_to_records``
+        resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
+
+    Returns:
+        dict: with keys
+            * "times" (np.ndarray): time of each annotation in PPQ
+            * "keys" (list): local key of each annotation
+            * "chords" (list): chord of each annotation
+            * "duration" (int): time of the last annotation in PPQ
+
+    """
+    offsets = np.fromiter(
+        map(operator.itemgetter("offset"), records),
+        dtype=np.float64,
+        count=len(records),
+    )
+    # np.rint rounds halves to even, like the builtin round
+    times = np.rint(offsets * resolution).astype(np.int64)
+    keys, chords = [], []
+    # hoist lookups out of the loop
+    get_fields = operator.itemgetter(
+        "key_str", "secondary_key_str", "pitchedCommonName"
+    )
+    # keys repeat a lot within a piece, so build each one once per call. The
+    # memo is local so that callers never share mutable music21 keys.
+    key_cache = {}
+    append_key, append_chord = keys.append, chords.append
+    for record in records:
+        key_str, secondary_key_str, chord = get_fields(record)
+        key_str = secondary_key_str or key_str
+        if key_str not in key_cache:
+            key_cache[key_str] = _key_from_string(key_str)
+        append_key(key_cache[key_str])
+        append_chord(chord)
+    return {
+        "times": times,
+        "keys": keys,
+        "chords": chords,
+        "duration": int(times[-1]) if len(times) else 0,
+    }
+
+
+def _to_records(times, names, record_class):
+    """Build the list of annotation records returned by the music21 format loaders
+
+    Args:
+        times (np.ndarray): annotation times in PPQ
+        names (list): annotation values
+        record_class (type): record type, e.g. ``_KeyRec``
+
+    Returns:
+        list: [record_class(time in PPQ, value)]
+
+    """
+    return [record_class(time, name) for time, name in zip(times.tolist(), names)]
 
 
 @io.coerce_to_string_io
@@ -186,29 +538,23 @@ def load_score(fhandle: TextIO):
         music21.stream.Score: score in music21 format
 
     """
-    score, rna = _split_score_annotations(fhandle)
-    return score
+    return _parse_score(fhandle)
 
 
-def _load_key_base(fhandle, resolution):
-    """Load haydn op20 key data from a file in music21 format
+def _load_key_base(records, resolution):
+    """Load haydn op20 key data from annotation records in music21 format
 
     Args:
-        fhandle (str or file-like): path to key annotations
+        records (list): annotation records, as returned by ``_rna_to_records``
         resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
 
     Returns:
-        list: musical key data and relative time (offset (Music21Object.offset) * resolution) [(time in PPQ, local key)]
+        np.ndarray: relative time of each annotation (offset (Music21Object.offset) * resolution) in PPQ
+        list: local key of each annotation
 
     """
-    _, rna = _split_score_annotations(fhandle)
-    annotations = []
-    for offset, rn in rna:
-        time = int(round(float(offset * resolution)))
-        tonicizedKey = rn.secondaryRomanNumeralKey
-        key = tonicizedKey or rn.key
-        annotations.append({"time": time, "key": key})
-    return annotations
+    annotations = _extract_all(records, resolution)
+    return annotations["times"], annotations["keys"]
 
 
 def _format_key_string(key_string):
@@ -218,13 +564,56 @@ def _format_key_string(key_string):
         key_string (str): unformatted key string
 
     Returns:
-        str: key_mode format key string
+        str: key_mode format key string, interned so that repeated keys share one object
     """
-    return key_string.replace("-", "b").replace(" ", ":")
+    return sys.intern(key_string.replace("-", "b").replace(" ", ":"))
+
+
+def _run_length_encode(times, names):
+    """Merge consecutive annotations with the same name into segments
+
+    Args:
+        times (np.ndarray or list): annotation times in ticks
+        names (list): annotation names
+
+    Returns:
+        np.ndarray: (n x 2) array of segment start and end times in ticks
+        list: name of each segment
+
+    """
+    times = np.asarray(times, dtype=np.int64)
+    # object arrays compare the (often interned) strings by identity first
+    names = np.asarray(names, dtype=object)
+    change = np.concatenate(([True], names[1:] != names[:-1]))
+    starts = times[change]
+    intervals = np.empty((len(starts), 2), dtype=np.float64)
+    intervals[:, 0] = starts
+    # the first segment always starts at the beginning of the piece
+    intervals[0, 0] = 0
+    intervals[:-1, 1] = starts[1:] - 1
+    intervals[-1, 1] = times[-1]
+    return intervals, names[change].tolist()
+
+
+def _keys_to_key_data(times, keys):
+    """Convert haydn op20 key data in music21 format to KeyData
+
+    Args:
+        times (np.ndarray or list): annotation times in PPQ, as returned by ``_load_key_base``
+        keys (list): local key of each annotation, as returned by ``_load_key_base``
+
+    Returns:
+        KeyData: loaded key data
+
+    """
+    intervals, key_names = _run_length_encode(
+        times, [_format_key_string(str(key)) for key in keys]
+    )
+    return KeyData(intervals, "ticks", key_names, "key_mode")
 
 
 @io.coerce_to_string_io
-def load_key(fhandle: TextIO, resolution=28):
+def load_key(fhandle: TextIO, resolution=DEFAULT_RESOLUTION):
     """Load haydn op20 key data from a file
 
     Args:
@@ -235,28 +624,11 @@ def load_key(fhandle: TextIO, resolution=28):
         KeyData: loaded key data
 
     """
-    keys = _load_key_base(fhandle, resolution)
-    start_times = [0]
-    end_times = []
-    key_names = [_format_key_string(str(keys[0]["key"]))]
-    for i, k in enumerate(keys):
-        this_key_string = _format_key_string(str(k["key"]))
-        # if this is a new key, add it to the list
-        if this_key_string != key_names[-1]:
-            end_times.append(keys[i]["time"] - 1)
-            start_times.append(keys[i]["time"])
-            key_names.append(this_key_string)
-    end_times.append(keys[-1]["time"])
-    return KeyData(
-        np.array([start_times, end_times]).astype(float).T,
-        "ticks",
-        key_names,
-        "key_mode",
-    )
+    return _keys_to_key_data(*_load_key_base(_load_records(fhandle), resolution))
 
 
 @io.coerce_to_string_io
-def load_key_music21(fhandle: TextIO, resolution=28):
+def load_key_music21(fhandle: TextIO, resolution=DEFAULT_RESOLUTION):
     """Load haydn op20 key data from a file in music21 format
 
     Args:
@@ -264,35 +636,263 @@ def load_key_music21(fhandle: TextIO, resolution=28):
         resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
 
     Returns:
-        list: musical key data and relative time (offset (Music21Object.offset) * resolution) [(time in PPQ, local key)]
+        list: musical key data and relative time (offset (Music21Object.offset) * resolution), as read-only dicts [{"time": time in PPQ, "key": local key}]
+
+    """
+    times, keys = _load_key_base(_load_records(fhandle), resolution)
+    return _to_records(times, keys, _KeyRec)
+
+
+def _midi_path_for(hrm_path, strip_annotations=False):
+    """Get the path of the midi file converted from a humdrum file
+
+    Args:
+        hrm_path (str): path to hrm annotations
+        strip_annotations (bool): if True, get the path of the midi file
+            converted without the roman numeral annotations
+
+    Returns:
+        str: midi file path
 
     """
-    return _load_key_base(fhandle, resolution)
+    suffix = "_stripped.midi" if strip_annotations else ".midi"
+    return os.path.splitext(hrm_path)[0] + suffix
+
+
+def _midi_exists(midi_path):
+    """Check if a midi file was already converted
+
+    Args:
+        midi_path (str): midi file path
+
+    Returns:
+        bool: True if the midi file exists
+
+    """
+    # opening through smart_open also works for remote data homes
+    try:
+        with open(midi_path, "rb"):
+            return True
+    except FileNotFoundError:
+        return False
+
+
+def _save_score_to_midi(score, midi_path):
+    """Write a music21 score to a midi file
+
+    Args:
+        score (music21.stream.Score): score in music21 format
+        midi_path (str): path where the midi file is written
+
+    """
+    midi_file = _require_music21().midi.translate.streamToMidiFile(score)
+    # serialize in memory and write the file in a single call
+    with open(midi_path, "wb") as fhandle:
+        fhandle.write(midi_file.writestr())
 
 
 @deprecated(
     reason="convert_and_save_to_midi is deprecated and will be removed in a future version",
     version="0.3.4",
 )
-@io.coerce_to_string_io
-def convert_and_save_to_midi(fpath: TextIO):
+def convert_and_save_to_midi(
+    fpath: Optional[Union[str, TextIO]], strip_annotations: bool = False
+):
     """convert to midi file and return the midi path
 
+    The score is only parsed if the midi file does not exist yet. The midi
+    file converted without annotations is written next to the score with a
+    ``_stripped.midi`` suffix, so that it is never confused with the one
+    converted with the annotations (e.g. by ``Track.midi_path``).
+
     Args:
         fpath (str or file-like): path to score file
+        strip_annotations (bool): if True, remove the roman numeral annotations
+            from the score before writing the midi file
 
     Returns:
         str: midi file path
 
     """
-    midi_path = os.path.splitext(fpath.name)[0] + ".midi"
-    score, _ = _split_score_annotations(fpath)
-    score.write("midi", fp=midi_path)
+    if not fpath:
+        return None
+    hrm_path = fpath if isinstance(fpath, str) else fpath.name
+    midi_path = _midi_path_for(hrm_path, strip_annotations)
+    if not _midi_exists(midi_path):
+        score = _parse_score_file(hrm_path)
+        if strip_annotations:
+            score.remove(
+                list(
+                    score.recurse().getElementsByClass(
+                        _require_music21().roman.RomanNumeral
+                    )
+                ),
+                recurse=True,
+            )
+        _save_score_to_midi(score, midi_path)
     return midi_path
 
 
+_KERN_DURATION = re.compile(r"(\d+)(?:%(\d+))?(\.*)")
+
+
+def _kern_duration(token):
+    """Get the duration of a kern token in quarter notes
+
+    Args:
+        token (str): kern token, e.g. "4.G" or "8c 8e"
+
+    Returns:
+        Fraction: duration in quarter notes, or None if the token has no duration
+
+    """
+    # in chords all the notes have the same duration
+    token = token.split(" ")[0]
+    if "q" in token or "Q" in token:
+        # grace notes take no time
+        return Fraction(0)
+    match = _KERN_DURATION.search(token)
+    if not match:
+        return None
+    reciprocal, numerator, dots = match.groups()
+    if int(reciprocal) == 0:
+        # breve (0), long (00) and maxima (000)
+        duration = Fraction(4 * int(numerator or 1) * 2 ** len(reciprocal))
+    else:
+        duration = Fraction(4 * int(numerator or 1), int(reciprocal))
+    return duration * (2 - Fraction(1, 2 ** len(dots)))
+
+
+def _load_rna_from_humdrum_text(fhandle: TextIO):
+    """Read the roman numerals of a haydn op20 humdrum file without the music21 parser
+
+    The figures are taken from the **harm spine, and their offsets are computed
+    from the durations in the **kern spines. Like in music21, a roman numeral
+    is only kept if a kern event occurs at the same time in one of the staves
+    named by the harm spine's ``*staff`` tandem, and roman numerals are
+    deduplicated by offset.
+
+    Args:
+        fhandle (str or file-like): path to hrm annotations
+
+    Returns:
+        list: list of roman numerals [(offset in quarter notes, figure)]
+
+    """
+    harmparser = _require_music21().humdrum.harmparser
+    spine_types: List[Optional[str]] = []
+    ends: List[Fraction] = []
+    # staff number of each kern spine, staff numbers applied to by each harm spine
+    staves: List[Optional[Tuple[int, ...]]] = []
+    time = Fraction(0)
+    rna = {}
+    for line in fhandle:
+        line = line.rstrip("\n")
+        if not line or line.startswith("!") or line.startswith("="):
+            continue
+        tokens = line.split("\t")
+        if line.startswith("*"):
+            # interpretation line: follow spine splits, joins and terminations
+            new_types: List[Optional[str]] = []
+            new_ends: List[Fraction] = []
+            new_staves: List[Optional[Tuple[int, ...]]] = []
+            i = 0
+            while i < len(tokens):
+                token = tokens[i]
+                if token.startswith("**"):
+                    new_types.append(token[2:])
+                    new_ends.append(time)
+                    new_staves.append(None)
+                elif token == "*^":
+                    new_types.extend([spine_types[i]] * 2)
+                    new_ends.extend([ends[i]] * 2)
+                    new_staves.extend([staves[i]] * 2)
+                elif token == "*v":
+                    j = i
+                    while j + 1 < len(tokens) and tokens[j + 1] == "*v":
+                        j += 1
+                    new_types.append(spine_types[i])
+                    new_ends.append(max(ends[i : j + 1]))
+                    new_staves.append(staves[i])
+                    i = j
+                elif token == "*+":
+                    new_types.extend([spine_types[i], None])
+                    new_ends.extend([ends[i], time])
+                    new_staves.extend([staves[i], None])
+                elif token == "*x" and i + 1 < len(tokens) and tokens[i + 1] == "*x":
+                    new_types.extend([spine_types[i + 1], spine_types[i]])
+                    new_ends.extend([ends[i + 1], ends[i]])
+                    new_staves.extend([staves[i + 1], staves[i]])
+                    i += 1
+                elif token != "*-":
+                    new_types.append(spine_types[i])
+                    new_ends.append(ends[i])
+                    # like music21, only the first *staff tandem of a spine is used
+                    if token.startswith("*staff") and staves[i] is None:
+                        new_staves.append(
+                            tuple(int(staff) for staff in token[6:].split("/"))
+                        )
+                    else:
+                        new_staves.append(staves[i])
+                i += 1
+            spine_types, ends, staves = new_types, new_ends, new_staves
+            continue
+
+        # data line
+        harms = []
+        event_staves: Set[int] = set()
+        has_grace_note = False
+        for i, token in enumerate(tokens):
+            if token == ".":
+                continue
+            if spine_types[i] == "harm":
+                harms.append((staves[i], token))
+            elif spine_types[i] == "kern":
+                kern_staves = staves[i]
+                if kern_staves is not None:
+                    event_staves.update(kern_staves)
+                duration = _kern_duration(token)
+                if duration == 0:
+                    has_grace_note = True
+                elif duration is not None:
+                    ends[i] = time + duration
+        for harm_staves, token in harms:
+            # music21 attaches the numeral to the events of the named staves
+            if harm_staves is not None and event_staves.intersection(harm_staves):
+                rna[float(time)] = harmparser.convertHarmToRoman(token)
+                break
+        if has_grace_note:
+            # the next event starts at the same time
+            continue
+        pending = [
+            end
+            for end, spine_type in zip(ends, spine_types)
+            if spine_type == "kern" and end > time
+        ]
+        if pending:
+            time = min(pending)
+    return list(rna.items())
+
+
+def _load_roman_numerals(rna, resolution):
+    """Load haydn op20 roman numerals data from roman numeral figures
+
+    Args:
+        rna (list): list of roman numerals [(offset in quarter notes, figure)]
+        resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
+
+    Returns:
+        list: musical roman numerals data and relative time (offset (Music21Object.offset) * resolution), as read-only dicts [{"time": time in PPQ, "roman_numeral": roman numeral}]
+
+    """
+    return [
+        _RomanNumeralRec(int(round(offset * resolution)), figure)
+        for offset, figure in rna
+    ]
+
+
 @io.coerce_to_string_io
-def load_roman_numerals(fhandle: TextIO, resolution=28):
+def load_roman_numerals(fhandle: TextIO, resolution=DEFAULT_RESOLUTION):
     """Load haydn op20 roman numerals data from a file
 
     Args:
@@ -300,40 +900,45 @@ def load_roman_numerals(fhandle: TextIO, resolution=28):
         resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
 
     Returns:
-        list: musical roman numerals data and relative time (offset (Music21Object.offset) * resolution) [(time in PPQ, roman numerals)]
+        list: musical roman numerals data and relative time (offset (Music21Object.offset) * resolution), as read-only dicts [{"time": time in PPQ, "roman_numeral": roman numeral}]
 
     """
-    _, rna = _split_score_annotations(fhandle)
-    annotations = []
-    for offset, rn in rna:
-        time = int(round(float(offset * resolution)))
-        figure = rn.figure
-        annotations.append({"time": time, "roman_numeral": figure})
-    return annotations
+    return _load_roman_numerals(_load_rna_from_humdrum_text(fhandle), resolution)
 
 
-def _load_chords_base(fhandle: TextIO, resolution: int = 28):
-    """Load haydn op20 chords data from a file in music21 format
+def _load_chords_base(records, resolution: int = DEFAULT_RESOLUTION):
+    """Load haydn op20 chords data from annotation records in music21 format
 
     Args:
-        fhandle (str or file-like): path to chord annotations
+        records (list): annotation records, as returned by ``_rna_to_records``
         resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
 
     Returns:
-        list: musical chords data and relative time (offset (Music21Object.offset) * resolution) [(time in PPQ, chord)]
+        np.ndarray: relative time of each annotation (offset (Music21Object.offset) * resolution) in PPQ
+        list: chord of each annotation
 
     """
-    _, rna = _split_score_annotations(fhandle)
-    annotations = []
-    for offset, rn in rna:
-        time = int(round(float(offset * resolution)))
-        chord = rn.pitchedCommonName
-        annotations.append({"time": time, "chord": chord})
-    return annotations
+    annotations = _extract_all(records, resolution)
+    return annotations["times"], annotations["chords"]
+
+
+def _chords_to_chord_data(times, chords):
+    """Convert haydn op20 chords data in music21 format to ChordData
+
+    Args:
+        times (np.ndarray or list): annotation times in PPQ, as returned by ``_load_chords_base``
+        chords (list): chord of each annotation, as returned by ``_load_chords_base``
+
+    Returns:
+        ChordData: chord annotations
+
+    """
+    intervals, chord_names = _run_length_encode(times, [str(chord) for chord in chords])
+    return ChordData(intervals, "ticks", chord_names, "open")
 
 
 @io.coerce_to_string_io
-def load_chords(fhandle: TextIO, resolution: int = 28):
+def load_chords(fhandle: TextIO, resolution: int = DEFAULT_RESOLUTION):
     """Load haydn op20 chords data from a file
 
     Args:
@@ -344,21 +949,11 @@ def load_chords(fhandle: TextIO, resolution: int = 28):
         ChordData: chord annotations
 
     """
-    chords = _load_chords_base(fhandle, resolution)
-    start_times, end_times, chord_names = [0], [], [str(chords[0]["chord"])]
-    for ii, k in enumerate(chords):
-        if str(k["chord"]) != chord_names[-1]:
-            end_times.append(chords[ii]["time"] - 1)
-            start_times.append(chords[ii]["time"])
-            chord_names.append(str(chords[ii]["chord"]))
-    end_times.append(chords[-1]["time"])
-    return ChordData(
-        np.array([start_times, end_times]).astype(float).T, "ticks", chord_names, "open"
-    )
+    return _chords_to_chord_data(*_load_chords_base(_load_records(fhandle), resolution))
 
 
 @io.coerce_to_string_io
-def load_chords_music21(fhandle: TextIO, resolution: int = 28):
+def load_chords_music21(fhandle: TextIO, resolution: int = DEFAULT_RESOLUTION):
     """Load haydn op20 chords data from a file in music21 format
 
     Args:
@@ -366,10 +961,52 @@ def load_chords_music21(fhandle: TextIO, resolution: int = 28):
         resolution (int): the number of pulses, or ticks, per quarter note (PPQ)
 
     Returns:
-        list: musical chords data and relative time (offset (Music21Object.offset) * resolution) [(time in PPQ, chord)]
+        list: musical chords data and relative time (offset (Music21Object.offset) * resolution), as read-only dicts [{"time": time in PPQ, "chord": chord}]
+
+    """
+    times, chords = _load_chords_base(_load_records(fhandle), resolution)
+    return _to_records(times, chords, _ChordRec)
+
+
+def _warm_cache(path, cache_dir):
+    """Store the annotation records of a humdrum file in the on-disk parse cache
+
+    Args:
+        path (str): path to hrm annotations
+        cache_dir (str): directory of the on-disk parse cache
+
+    Returns:
+        bool: False if the file does not exist
+
+    """
+    try:
+        _cached_parse(path, cache_dir=cache_dir)
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _load_track_properties(
+    track_id, data_home, index, properties, use_parse_cache, cache_dir
+):
+    """Load the cached properties of a track in a worker process
+
+    Args:
+        track_id (str): track id of the track
+        data_home (str): path where mirdata will look for the dataset
+        index (dict): the dataset's file index, or the part of it with this track
+        properties (list): names of the cached properties to load
+        use_parse_cache (bool): whether to use the on-disk parse cache
+        cache_dir (str): directory of the on-disk parse cache
+
+    Returns:
+        dict: {property name: property value}
 
     """
-    return _load_chords_base(fhandle, resolution)
+    track = Track(track_id, data_home, "haydn_op20", index, lambda: None)
+    track._use_parse_cache = use_parse_cache
+    track._cache_dir = cache_dir
+    return {prop: getattr(track, prop) for prop in properties}
 
 
 @core.docstring_inherit(core.Dataset)
@@ -389,6 +1026,95 @@ class Dataset(core.Dataset):
             license_info=LICENSE_INFO,
         )
 
+    def load_tracks(self, track_ids=None, properties=None, n_jobs=-1, cache_dir=None):
+        """Load tracks in the dataset, optionally loading their data in parallel
+
+        Tracks are independent, so when ``properties`` is given each humdrum
+        file is parsed in a separate worker process.
+
+        Args:
+            track_ids (list or None): ids of the tracks to load. If None, all tracks are loaded.
+            properties (list or None): names of the cached properties to load eagerly,
+                e.g. ``("keys", "chords", "duration")``. The values must be picklable.
+                If None, track data is loaded lazily on access.
+            n_jobs (int): number of worker processes. -1 uses all CPUs.
+            cache_dir (str or None): directory of the on-disk parse cache, used when
+                ``USE_PARSE_CACHE`` is enabled. If None, ``~/.cache/mirdata/haydn_op20`` is used.
+
+        Returns:
+            dict:
+                {`track_id`: track data}
+
+        """
+        if track_ids is None:
+            track_ids = self.track_ids
+        # worker processes import this module again, so pass the directory explicitly
+        if cache_dir is None:
+            cache_dir = _CACHE_DIR
+        tracks = {track_id: self.track(track_id) for track_id in track_ids}
+        for track in tracks.values():
+            track._cache_dir = cache_dir
+        if not properties:
+            return tracks
+
+        import joblib
+
+        results = joblib.Parallel(n_jobs=n_jobs, backend="loky")(
+            joblib.delayed(_load_track_properties)(
+                track_id,
+                self.data_home,
+                {"tracks": {track_id: self._index["tracks"][track_id]}},
+                properties,
+                track._use_parse_cache,
+                cache_dir,
+            )
+            for track_id, track in tracks.items()
+        )
+        # store the values the same way core.cached_property does
+        for track, values in zip(tracks.values(), results):
+            track.__dict__.update(values)
+        return tracks
+
+    def warmup(self, track_ids=None, n_jobs=-1, cache_dir=None):
+        """Parse the humdrum files in parallel and store them in the on-disk parse cache
+
+        Once the cache is populated, loading a track with ``USE_PARSE_CACHE``
+        enabled (including through ``load_tracks``) only reads the cached
+        annotations from disk instead of running the music21 parser.
+        Tracks whose files are missing are skipped.
+
+        Args:
+            track_ids (list or None): ids of the tracks to parse. If None, all tracks are parsed.
+            n_jobs (int): number of worker processes. -1 uses all CPUs.
+            cache_dir (str or None): directory of the on-disk parse cache.
+                If None, ``~/.cache/mirdata/haydn_op20`` is used.
+
+        Returns:
+            list: ids of the tracks whose files are missing
+
+        """
+        if track_ids is None:
+            track_ids = self.track_ids
+        # worker processes import this module again, so pass the directory explicitly
+        if cache_dir is None:
+            cache_dir = _CACHE_DIR
+        import joblib
+
+        found = joblib.Parallel(n_jobs=n_jobs, backend="loky")(
+            joblib.delayed(_warm_cache)(
+                self.track(track_id).humdrum_annotated_path, cache_dir
+            )
+            for track_id in track_ids
+        )
+        missing = [track_id for track_id, ok in zip(track_ids, found) if not ok]
+        if missing:
+            logging.warning(
+                "Skipped {} haydn_op20 tracks with missing files: {}".format(
+                    len(missing), ", ".join(missing)
+                )
+            )
+        return missing
+
     @deprecated(
         reason="Use mirdata.datasets.haydn_op20.load_score",
         version="0.3.4",
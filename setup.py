@@ -66,7 +66,7 @@ if __name__ == "__main__":
                 "sphinx_rtd_theme",
             ],
             "dali": ["dali-dataset==1.1"],
-            "haydn_op20": ["music21==6.7.1"],
+            "haydn_op20": ["music21==6.7.1", "joblib"],
             "gcs": ["smart_open[gcs]"],
             "s3": ["smart_open[s3]"],
             "http": ["smart_open[http]"],
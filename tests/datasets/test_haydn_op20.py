@@ -1,4 +1,10 @@
+import io
+import os
+import pickle
+import shutil
+
 import music21
+import pytest
 
 from mirdata.annotations import KeyData, ChordData
 from mirdata.datasets import haydn_op20
@@ -97,6 +103,11 @@ def test_load_score():
     assert isinstance(score, music21.stream.Score)
     assert len(score.parts) == 4
 
+    with open(path) as fhandle:
+        score = haydn_op20.load_score(io.StringIO(fhandle.read()))
+    assert isinstance(score, music21.stream.Score)
+    assert len(score.parts) == 4
+
 
 def test_load_key():
     path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
@@ -118,6 +129,11 @@ def test_load_key():
     assert key_music21[-1]["time"] == 644
     assert isinstance(key_music21[0]["key"], music21.key.Key)
 
+    # loads do not share mutable keys
+    key_music21[0]["key"].transpose(2, inPlace=True)
+    assert str(haydn_op20.load_key_music21(path)[0]["key"]) == "E- major"
+    assert np.array_equal(haydn_op20.load_key(path).keys, ["Eb:major", "Bb:major"])
+
 
 def test_load_chords():
     path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
@@ -165,9 +181,192 @@ def test_load_roman_numerals():
     assert roman_numerals[0]["roman_numeral"] == "I"
     assert roman_numerals[-1]["roman_numeral"] == "V43/V"
 
+    score = haydn_op20.load_score(path)
+    with open(path) as fhandle:
+        rna = haydn_op20._load_rna_from_humdrum_text(fhandle)
+    assert rna == [
+        (float(offset), rn.figure) for offset, rn in haydn_op20._extract_rna(score)
+    ]
+
+
+def test_load_rna_from_humdrum_text_staves():
+    # the harm spine only applies to staff 2, which has no event at offset 1
+    humdrum = "\n".join(
+        [
+            "**harm\t**kern\t**kern",
+            "*staff2\t*staff2\t*staff1",
+            "*M4/4\t*M4/4\t*M4/4",
+            "=1-\t=1-\t=1-",
+            "I\t2c\t4e",
+            "V\t.\t4d",
+            "IV\t4f\t4c",
+            ".\t4g\t4e",
+            "==\t==\t==",
+            "*-\t*-\t*-",
+            "",
+        ]
+    )
+    score = haydn_op20.load_score(io.StringIO(humdrum))
+    expected = [
+        (float(offset), rn.figure) for offset, rn in haydn_op20._extract_rna(score)
+    ]
+    assert expected == [(0.0, "I"), (2.0, "IV")]
+    rna = haydn_op20._load_rna_from_humdrum_text(io.StringIO(humdrum))
+    assert rna == expected
+
+    # a lone spine exchange is ignored
+    humdrum = humdrum.replace("*M4/4\t*M4/4\t*M4/4", "*M4/4\t*M4/4\t*x")
+    rna = haydn_op20._load_rna_from_humdrum_text(io.StringIO(humdrum))
+    assert rna == expected
+
 
 def test_load_midi_path():
     path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
     midi_path = haydn_op20.convert_and_save_to_midi(path)
     assert isinstance(midi_path, str)
     assert midi_path == "tests/resources/mir_datasets/haydn_op20/op20n1-01.midi"
+
+
+def test_convert_and_save_to_midi(tmpdir):
+    path = os.path.join(str(tmpdir), "op20n1-01.hrm")
+    shutil.copy("tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm", path)
+    midi_path = haydn_op20.convert_and_save_to_midi(path)
+    assert midi_path == os.path.join(str(tmpdir), "op20n1-01.midi")
+    assert os.path.exists(midi_path)
+    assert haydn_op20.convert_and_save_to_midi(None) is None
+
+    # an existing conversion with the annotations is not reused when stripping
+    stripped_path = haydn_op20.convert_and_save_to_midi(path, strip_annotations=True)
+    assert stripped_path == os.path.join(str(tmpdir), "op20n1-01_stripped.midi")
+    assert os.path.exists(stripped_path)
+    with open(midi_path, "rb") as fhandle, open(stripped_path, "rb") as fstripped:
+        assert fhandle.read() != fstripped.read()
+
+
+def test_cached_parse(tmpdir):
+    path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
+    cache_dir = str(tmpdir)
+    records = haydn_op20._cached_parse(path, cache_dir=cache_dir)
+    assert len(tmpdir.listdir()) == 1
+    assert haydn_op20._cached_parse(path, cache_dir=cache_dir) == records
+
+    assert records[0]["offset"] == 0.0
+    assert "figure" not in records[0]
+    assert records[0]["key_str"] == "E- major"
+    assert records[-1]["secondary_key_str"] == "B- major"
+    assert records[-1]["pitchedCommonName"] == "F-dominant seventh chord"
+
+    times, keys = haydn_op20._load_key_base(records, 28)
+    assert times.dtype == np.int64
+    assert times.tolist() == [0, 364, 392, 644]
+    assert isinstance(keys[0], music21.key.Key)
+
+    # corrupt cache files are parsed again and replaced
+    cache_file = tmpdir.listdir()[0]
+    cache_file.write_binary(b"\x80")
+    assert haydn_op20._cached_parse(path, cache_dir=cache_dir) == records
+    assert haydn_op20._cached_parse(path, cache_dir=cache_dir) == records
+    assert tmpdir.listdir() == [cache_file]
+
+    # records written with another format version are not reused
+    haydn_op20._CACHE_VERSION += 1
+    try:
+        assert haydn_op20._cached_parse(path, cache_dir=cache_dir) == records
+    finally:
+        haydn_op20._CACHE_VERSION -= 1
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_cached_parse_write_error(tmpdir, mocker):
+    path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
+    mocker.patch.object(haydn_op20.pickle, "dump", side_effect=RuntimeError)
+    with pytest.raises(RuntimeError):
+        haydn_op20._cached_parse(path, cache_dir=str(tmpdir))
+    assert tmpdir.listdir() == []
+
+
+def test_track_cached_records(tmpdir, monkeypatch, mocker):
+    monkeypatch.setattr(haydn_op20, "_CACHE_DIR", str(tmpdir))
+    data_home = "tests/resources/mir_datasets/haydn_op20"
+    track = haydn_op20.Dataset(data_home).track("0")
+    track._use_parse_cache = True
+    parse = mocker.spy(haydn_op20, "_parse_score_file")
+    assert isinstance(track.score, music21.stream.Score)
+    assert track.duration == 644
+    assert parse.call_count == 1
+
+
+def test_load_tracks():
+    data_home = "tests/resources/mir_datasets/haydn_op20"
+    dataset = haydn_op20.Dataset(data_home)
+
+    tracks = dataset.load_tracks()
+    assert len(tracks) == len(dataset.track_ids)
+    assert "keys" not in tracks["0"].__dict__
+
+    tracks = dataset.load_tracks(
+        track_ids=["0"], properties=("keys", "chords", "duration"), n_jobs=2
+    )
+    assert list(tracks.keys()) == ["0"]
+    track = tracks["0"]
+    assert "keys" in track.__dict__
+    assert isinstance(track.keys, KeyData)
+    assert isinstance(track.chords, ChordData)
+    assert track.duration == 644
+    assert np.array_equal(track.keys.keys, ["Eb:major", "Bb:major"])
+
+
+def test_warmup(tmpdir, monkeypatch):
+    data_home = "tests/resources/mir_datasets/haydn_op20"
+    dataset = haydn_op20.Dataset(data_home)
+    cache_dir = str(tmpdir)
+    monkeypatch.setattr(haydn_op20, "USE_PARSE_CACHE", True)
+
+    # the test data only has track "0"
+    missing = dataset.warmup(track_ids=["0", "1"], n_jobs=2, cache_dir=cache_dir)
+    assert missing == ["1"]
+    assert len(tmpdir.listdir()) == 1
+    cache_file = tmpdir.listdir()[0]
+    assert cache_file.ext == ".pkl"
+
+    # the workers of load_tracks read the same cache directory
+    records = pickle.loads(cache_file.read_binary())
+    for record in records:
+        record["pitchedCommonName"] = "cached chord"
+    cache_file.write_binary(pickle.dumps(records))
+    tracks = dataset.load_tracks(
+        track_ids=["0"], properties=("chords",), n_jobs=2, cache_dir=cache_dir
+    )
+    assert tracks["0"].chords.labels == ["cached chord"]
+
+    monkeypatch.setattr(haydn_op20, "_CACHE_DIR", cache_dir)
+    track = dataset.track("0")
+    assert track.duration == 644
+    assert "_parsed" not in track.__dict__
+
+
+def test_annotation_records():
+    path = "tests/resources/mir_datasets/haydn_op20/op20n1-01.hrm"
+    keys = haydn_op20.load_key_music21(path)
+    assert not hasattr(keys[0], "__dict__")
+    assert keys[0].time == keys[0]["time"] == 0
+    with pytest.raises(KeyError):
+        keys[0]["chord"]
+    assert pickle.loads(pickle.dumps(keys)) == keys
+
+    # records behave like read-only dicts
+    record = keys[0]
+    assert "time" in record
+    assert "chord" not in record
+    assert list(record) == ["time", "key"]
+    assert dict(record) == {"time": 0, "key": record["key"]}
+    assert record == {"time": 0, "key": record["key"]}
+    assert record.get("time") == 0
+    assert record.get("chord") is None
+    with pytest.raises(AttributeError):
+        record.time = 1
+
+    chords = haydn_op20.load_chords_music21(path)
+    assert dict(chords[0]) == {"time": 0, "chord": "Eb-major triad"}
+    roman_numerals = haydn_op20.load_roman_numerals(path)
+    assert roman_numerals[0] == {"time": 0, "roman_numeral": "I"}